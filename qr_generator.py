@@ -1,5 +1,9 @@
+import functools
 import os
 import re
+import sched
+import secrets
+import stat
 import sys
 import time
 import threading
@@ -12,56 +16,85 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
+from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+O_DSYNC: Final[int] = getattr(os, 'O_DSYNC', 0)
+O_BINARY: Final[int] = getattr(os, 'O_BINARY', 0)
+fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+ERASE_CHUNK_SIZE: Final[int] = 65536
+
+QR_PANEL_TITLE: Final[Text] = Text.from_markup("[bold cyan]Scannable QR Code[/bold cyan]")
+RESULT_PANEL_TITLE: Final[Text] = Text.from_markup("[bold green]QR Code Generated[/bold green]")
+COMMANDS_HINT: Final[Text] = Text.from_markup(
+    "[dim]Commands: [bold]r[/bold]=reset timer | [bold]e[/bold]=erase now | [bold]q[/bold]=quit without erase[/dim]\n"
+)
+INVALID_COMMAND: Final[Text] = Text.from_markup("[dim]Invalid command. Use: r (reset) | e (erase) | q (quit)[/dim]")
+
+INPUT_PROMPT: Final[Text] = Text.from_markup("[cyan]>[/cyan] ")
+
 class QRConnectError(Exception):
     pass
 
-class InputValidator:
-    MAX_DATA_LENGTH: Final[int] = 4096
-    MAX_FILENAME_LENGTH: Final[int] = 255
-    ALLOWED_EXTENSIONS: Final[tuple] = ('.png', '.jpg', '.jpeg')
-    DANGEROUS_PATTERNS: Final[tuple] = (
-        r'\.\.',
-        r'[<>:"|?*]',
-        r'^\/|\\',
-        r'\0'
-    )
+MAX_DATA_LENGTH: Final[int] = 4096
+MAX_FILENAME_LENGTH: Final[int] = 255
+ALLOWED_EXTENSIONS: Final[tuple] = ('.png', '.jpg', '.jpeg')
+DANGEROUS_PATTERNS: Final[tuple] = (
+    r'\.\.',
+    r'[<>:"|?*]',
+    r'^\/|\\',
+    r'\0'
+)
+DANGEROUS_PATTERN: Final[re.Pattern] = re.compile('|'.join(DANGEROUS_PATTERNS))
+
+def sanitize_filename(
+    filename: str,
+    _max_length: int = MAX_FILENAME_LENGTH,
+    _allowed_extensions: tuple = ALLOWED_EXTENSIONS,
+    _dangerous_pattern: re.Pattern = DANGEROUS_PATTERN,
+) -> str:
+    if not filename or len(filename) > _max_length:
+        raise QRConnectError("Invalid filename length")
     
-    @staticmethod
-    def sanitize_filename(filename: str) -> str:
-        if not filename or len(filename) > InputValidator.MAX_FILENAME_LENGTH:
-            raise QRConnectError("Invalid filename length")
-        
-        filename = filename.strip()
-        
-        for pattern in InputValidator.DANGEROUS_PATTERNS:
-            if re.search(pattern, filename):
-                raise QRConnectError("Filename contains invalid characters")
-        
-        path = Path(filename)
-        if path.suffix.lower() not in InputValidator.ALLOWED_EXTENSIONS:
-            filename = f"{path.stem}.png"
-        
-        if path.is_absolute() or '..' in path.parts:
-            raise QRConnectError("Absolute paths not allowed")
-        
-        return filename
+    filename = filename.strip()
     
-    @staticmethod
-    def validate_data(data: str) -> str:
-        if not data or not data.strip():
-            raise QRConnectError("Data cannot be empty")
-        
-        if len(data) > InputValidator.MAX_DATA_LENGTH:
-            raise QRConnectError(f"Data exceeds maximum length of {InputValidator.MAX_DATA_LENGTH}")
-        
-        if '\0' in data:
-            raise QRConnectError("Data contains null bytes")
-        
-        return data.strip()
+    if _dangerous_pattern.search(filename):
+        raise QRConnectError("Filename contains invalid characters")
+    
+    path = Path(filename)
+    if path.suffix.lower() not in _allowed_extensions:
+        filename = f"{path.stem}.png"
+    
+    if path.is_absolute() or '..' in path.parts:
+        raise QRConnectError("Absolute paths not allowed")
+    
+    return filename
+
+def validate_data(data: str, _max_length: int = MAX_DATA_LENGTH) -> str:
+    data = data.strip() if data else data
+    if not data:
+        raise QRConnectError("Data cannot be empty")
+    
+    if len(data) > _max_length:
+        raise QRConnectError(f"Data exceeds maximum length of {_max_length}")
+    
+    if '\0' in data:
+        raise QRConnectError("Data contains null bytes")
+    
+    return data
+
+class InputValidator:
+    MAX_DATA_LENGTH: Final[int] = MAX_DATA_LENGTH
+    MAX_FILENAME_LENGTH: Final[int] = MAX_FILENAME_LENGTH
+    ALLOWED_EXTENSIONS: Final[tuple] = ALLOWED_EXTENSIONS
+    DANGEROUS_PATTERNS: Final[tuple] = DANGEROUS_PATTERNS
+    DANGEROUS_PATTERN: Final[re.Pattern] = DANGEROUS_PATTERN
+    
+    sanitize_filename = staticmethod(sanitize_filename)
+    validate_data = staticmethod(validate_data)
 
 class SecureFileEraser:
     VSITR_PASSES: Final[int] = 7
@@ -74,40 +107,48 @@ class SecureFileEraser:
         b'\xFF',
         b'\xAA'
     )
+    CHUNK_SIZE: Final[int] = ERASE_CHUNK_SIZE
+    SMALL_FILE_LIMIT: Final[int] = 1 << 20
+    VSITR_BUFFERS: Final[dict] = {
+        pattern: memoryview(pattern * ERASE_CHUNK_SIZE) for pattern in set(VSITR_PATTERNS)
+    }
     
     @staticmethod
-    def secure_erase(filepath: Path) -> bool:
+    def secure_erase(filepath: Path, fast: bool = False) -> bool:
         try:
-            if not filepath.exists() or not filepath.is_file():
+            try:
+                file_stat = os.stat(filepath)
+            except (FileNotFoundError, NotADirectoryError):
                 return False
             
-            file_size = filepath.stat().st_size
+            if not stat.S_ISREG(file_stat.st_mode):
+                return False
+            
+            file_size = file_stat.st_size
+            synced = bool(O_DSYNC) and file_size <= SecureFileEraser.SMALL_FILE_LIMIT
             
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console
             ) as progress:
-                task = progress.add_task("Securely erasing file (VSITR)...", total=None)
-                
-                for pass_num in range(SecureFileEraser.VSITR_PASSES):
-                    pattern = SecureFileEraser.VSITR_PATTERNS[pass_num]
-                    
-                    with open(filepath, 'r+b') as f:
-                        f.seek(0)
+                fd = os.open(filepath, os.O_WRONLY | O_BINARY | (O_DSYNC if synced else 0))
+                try:
+                    if fast and not SecureFileEraser._is_rotational(file_stat.st_dev):
+                        task = progress.add_task("Securely erasing file (random pass)...", total=None)
                         
-                        chunk_size = 65536
-                        remaining = file_size
+                        SecureFileEraser._overwrite(fd, file_size, None, synced)
                         
-                        while remaining > 0:
-                            write_size = min(chunk_size, remaining)
-                            f.write(pattern * write_size)
-                            remaining -= write_size
+                        progress.update(task, description="Random pass 1/1")
+                    else:
+                        task = progress.add_task("Securely erasing file (VSITR)...", total=None)
                         
-                        f.flush()
-                        os.fsync(f.fileno())
-                    
-                    progress.update(task, description=f"VSITR pass {pass_num + 1}/{SecureFileEraser.VSITR_PASSES}")
+                        for pass_num in range(SecureFileEraser.VSITR_PASSES):
+                            SecureFileEraser._overwrite(fd, file_size, pass_num, synced)
+                            
+                            progress.update(task, description=f"VSITR pass {pass_num + 1}/{SecureFileEraser.VSITR_PASSES}")
+                finally:
+                    os.close(fd)
             
             filepath.unlink()
             
@@ -117,57 +158,161 @@ class SecureFileEraser:
         except Exception as e:
             console.print(f"\n Error during secure erasure: {str(e)}\n")
             return False
+    
+    @staticmethod
+    def _overwrite(fd: int, file_size: int, pass_num: Optional[int], synced: bool) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        
+        if synced:
+            SecureFileEraser._write_all(fd, SecureFileEraser._fill(pass_num, file_size))
+            return
+        
+        chunk_size = SecureFileEraser.CHUNK_SIZE
+        remaining = file_size
+        
+        while remaining > 0:
+            write_size = min(chunk_size, remaining)
+            SecureFileEraser._write_all(fd, SecureFileEraser._fill(pass_num, write_size))
+            remaining -= write_size
+        
+        fdatasync(fd)
+    
+    @staticmethod
+    def _write_all(fd: int, data) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    
+    @staticmethod
+    def _fill(pass_num: Optional[int], size: int):
+        if pass_num is None:
+            return secrets.token_bytes(size)
+        
+        pattern = SecureFileEraser.VSITR_PATTERNS[pass_num]
+        buffer = SecureFileEraser.VSITR_BUFFERS[pattern]
+        if size > len(buffer):
+            return pattern * size
+        
+        return buffer[:size]
+    
+    @staticmethod
+    def _is_rotational(st_dev: int) -> bool:
+        if not hasattr(os, 'major'):
+            return True
+        
+        device = Path(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+        for rotational in (device / "queue" / "rotational", device / ".." / "queue" / "rotational"):
+            try:
+                return rotational.read_text().strip() != '0'
+            except OSError:
+                continue
+        
+        return True
+
+class EraseScheduler:
+    def __init__(self):
+        self.scheduler = sched.scheduler(time.monotonic, self._delay)
+        self.wakeup = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+    
+    def enter(self, delay_seconds: float, action) -> sched.Event:
+        event = self.scheduler.enter(delay_seconds, 0, action)
+        
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        
+        self.wakeup.set()
+        return event
+    
+    def cancel(self, event: sched.Event) -> None:
+        try:
+            self.scheduler.cancel(event)
+        except ValueError:
+            pass
+    
+    def _delay(self, timeout: float) -> None:
+        self.wakeup.wait(timeout)
+        self.wakeup.clear()
+    
+    def _run(self) -> None:
+        while True:
+            self.scheduler.run()
+            self.wakeup.wait()
+            self.wakeup.clear()
+
+erase_scheduler = EraseScheduler()
 
 class AutoEraseTimer:
     def __init__(self, filepath: Path, delay_seconds: int = 30):
         self.filepath = filepath
         self.delay_seconds = delay_seconds
-        self.timer: Optional[threading.Timer] = None
+        self.event: Optional[sched.Event] = None
         self.lock = threading.Lock()
         self.cancelled = False
     
     def start(self) -> None:
         with self.lock:
-            if self.timer is not None:
-                self.timer.cancel()
-            
-            self.cancelled = False
-            self.timer = threading.Timer(self.delay_seconds, self._erase_callback)
-            self.timer.daemon = True
-            self.timer.start()
-            
+            self._schedule()
             console.print(f"Auto-erase timer started: {self.delay_seconds} seconds\n")
     
     def reset(self) -> None:
         with self.lock:
-            if not self.cancelled and self.timer is not None:
-                self.timer.cancel()
-                self.start()
+            if not self.cancelled and self.event is not None:
+                self._schedule()
                 console.print(f"Timer reset: {self.delay_seconds} seconds remaining\n")
     
     def cancel(self) -> None:
         with self.lock:
             self.cancelled = True
-            if self.timer is not None:
-                self.timer.cancel()
-                self.timer = None
+            if self.event is not None:
+                erase_scheduler.cancel(self.event)
+                self.event = None
+    
+    def _schedule(self) -> None:
+        if self.event is not None:
+            erase_scheduler.cancel(self.event)
+        
+        self.cancelled = False
+        self.event = erase_scheduler.enter(self.delay_seconds, self._erase_callback)
     
     def _erase_callback(self) -> None:
         with self.lock:
             if self.cancelled:
                 return
             
+            self.event = None
             console.print("\n initiating secure erasure\n")
             SecureFileEraser.secure_erase(self.filepath)
 
+QR_BORDER: Final[int] = 4
+
+@functools.lru_cache(maxsize=32)
+def qr_matrix(data: str, error_correction: int = qrcode.constants.ERROR_CORRECT_H) -> tuple:
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=error_correction,
+        box_size=1,
+        border=QR_BORDER,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    
+    return tuple(map(tuple, qr.get_matrix()))
+
 class QRConnect:
     DEFAULT_SIZE: Final[tuple] = (300, 300)
     MIN_SIZE: Final[int] = 100
     MAX_SIZE: Final[int] = 2000
+    ASCII_BORDER: Final[int] = 2
+    ASCII_TABLE: Final[dict] = str.maketrans({'\x00': '  ', '\x01': '██'})
+    PIXEL_TABLE: Final[bytes] = bytes.maketrans(b'\x00\x01', b'\xff\x00')
     
     def __init__(self, data: str, filename: str = "qrcode.png", size: tuple = DEFAULT_SIZE):
-        self.data = InputValidator.validate_data(data)
-        self.filename = InputValidator.sanitize_filename(filename)
+        self.data = validate_data(data)
+        self.filename = sanitize_filename(filename)
         self.size = self._validate_size(size)
         self.erase_timer: Optional[AutoEraseTimer] = None
     
@@ -184,31 +329,38 @@ class QRConnect:
         
         return size
     
-    def _generate_ascii_qr(self) -> str:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
-            box_size=1,
-            border=2,
-        )
-        qr.add_data(self.data)
-        qr.make(fit=True)
+    def _render_image(self) -> Image.Image:
+        matrix = qr_matrix(self.data)
+        modules = len(matrix)
+        
+        pixels = b''.join(map(bytes, matrix)).translate(self.PIXEL_TABLE)
+        img = Image.frombytes('L', (modules, modules), pixels).convert('1', dither=Image.Dither.NONE)
+        
+        width, height = self.size
+        scale = min(width, height) // modules
+        if scale < 1:
+            raise QRConnectError(f"Size too small for data ({modules} modules)")
         
-        return qr.get_matrix()
+        img = img.resize((modules * scale, modules * scale), Image.Resampling.NEAREST)
+        canvas = Image.new('1', self.size, 255)
+        canvas.paste(img, ((width - img.width) // 2, (height - img.height) // 2))
+        
+        return canvas
+    
+    def _generate_ascii_qr(self) -> list:
+        trim = QR_BORDER - self.ASCII_BORDER
+        matrix = qr_matrix(self.data)
+        
+        return [row[trim:len(row) - trim] for row in matrix[trim:len(matrix) - trim]]
     
     def display_ascii_qr(self) -> None:
         matrix = self._generate_ascii_qr()
         
-        ascii_art = []
-        for row in matrix:
-            line = ''.join('██' if cell else '  ' for cell in row)
-            ascii_art.append(line)
-        
-        qr_content = '\n'.join(ascii_art)
+        qr_content = b'\n'.join(map(bytes, matrix)).decode('latin-1').translate(self.ASCII_TABLE)
         
         panel = Panel(
             qr_content,
-            title="[bold cyan]Scannable QR Code[/bold cyan]",
+            title=QR_PANEL_TITLE,
             border_style="cyan",
             padding=(1, 2)
         )
@@ -219,17 +371,7 @@ class QRConnect:
     
     def generate_qr_code(self) -> None:
         try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_H,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(self.data)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white").convert('RGB')
-            img = img.resize(self.size, Image.Resampling.LANCZOS)
+            img = self._render_image()
             
             output_path = Path(self.filename)
             if output_path.exists():
@@ -242,7 +384,7 @@ class QRConnect:
                 if overwrite.lower() != 'y':
                     raise QRConnectError("Operation cancelled by user")
             
-            img.save(str(output_path), optimize=True)
+            img.save(str(output_path), compress_level=1)
             
             table = Table(show_header=False, box=None, padding=(0, 1))
             table.add_row(" Status", "Success")
@@ -251,7 +393,7 @@ class QRConnect:
             table.add_row(" Security", "Auto-erase enabled")
             
             console.print("\n")
-            console.print(Panel(table, title="[bold green]QR Code Generated[/bold green]", border_style="green"))
+            console.print(Panel(table, title=RESULT_PANEL_TITLE, border_style="green"))
             
             self.display_ascii_qr()
             
@@ -260,44 +402,62 @@ class QRConnect:
             
             self._monitor_scans()
             
+        except QRConnectError:
+            raise
         except OSError as e:
             raise QRConnectError(f"File system error: {str(e)}")
         except Exception as e:
             raise QRConnectError(f"Unexpected error: {str(e)}")
     
     def _monitor_scans(self) -> None:
-        console.print("[dim]Commands: [bold]r[/bold]=reset timer | [bold]e[/bold]=erase now | [bold]q[/bold]=quit without erase[/dim]\n")
+        console.print(COMMANDS_HINT)
+        
+        commands = {
+            'r': self._reset_timer,
+            'e': self._erase_now,
+            'q': self._quit,
+        }
         
         try:
             while True:
-                user_input = console.input("[cyan]>[/cyan] ").strip().lower()
+                console.print(INPUT_PROMPT, end="")
                 
-                if user_input == 'r':
-                    if self.erase_timer:
-                        self.erase_timer.reset()
-                    
-                elif user_input == 'e':
-                    if self.erase_timer:
-                        self.erase_timer.cancel()
-                    
-                    output_path = Path(self.filename)
-                    if output_path.exists():
-                        SecureFileEraser.secure_erase(output_path)
+                line = sys.stdin.readline()
+                if not line:
+                    self._quit()
                     break
-                    
-                elif user_input == 'q':
-                    if self.erase_timer:
-                        self.erase_timer.cancel()
-                    console.print("\n[yellow]Exiting without erasure[/yellow]\n")
+                
+                if commands.get(line.strip().lower(), self._invalid_command)():
                     break
                     
-                else:
-                    console.print("[dim]Invalid command. Use: r (reset) | e (erase) | q (quit)[/dim]")
-                    
         except KeyboardInterrupt:
             if self.erase_timer:
                 self.erase_timer.cancel()
             console.print("\n\n[yellow]Monitoring interrupted[/yellow]\n")
+    
+    def _reset_timer(self) -> bool:
+        if self.erase_timer:
+            self.erase_timer.reset()
+        return False
+    
+    def _erase_now(self) -> bool:
+        if self.erase_timer:
+            self.erase_timer.cancel()
+        
+        output_path = Path(self.filename)
+        if output_path.exists():
+            SecureFileEraser.secure_erase(output_path)
+        return True
+    
+    def _quit(self) -> bool:
+        if self.erase_timer:
+            self.erase_timer.cancel()
+        console.print("\n[yellow]Exiting without erasure[/yellow]\n")
+        return True
+    
+    def _invalid_command(self) -> bool:
+        console.print(INVALID_COMMAND)
+        return False
 
 def main() -> None:
     try: